@@ -4,6 +4,8 @@ import re
 import os
 import glob
 import logging
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
 import dateutil
 import pandas as pd
@@ -18,12 +20,33 @@ from .virtualrealization import VirtualRealization
 from .virtualensemble import VirtualEnsemble
 from .ensemblecombination import EnsembleCombination
 from .realization import parse_number
-from .util import shortcut2path
+from .util import shortcut2path, use_concurrent
 from .util.dates import unionize_smry_dates
 
 logger = logging.getLogger(__name__)
 
 
+def _load_scratch_realization(
+    realdir, realidxregexp=None, autodiscovery=True, batch=None
+):
+    """Construct a single ScratchRealization from a directory.
+
+    Module level function so that it can be dispatched to a
+    ProcessPoolExecutor. The cached EclSum object, if any was loaded
+    through batch commands, is dropped since it cannot be pickled back
+    to the parent process.
+    """
+    realization = ScratchRealization(
+        realdir,
+        realidxregexp=realidxregexp,
+        autodiscovery=autodiscovery,
+        batch=batch,
+    )
+    realization._eclsum = None
+    realization._drop_eclsum_caches()
+    return realization
+
+
 class ScratchEnsemble(object):
     """An ensemble is a collection of Realizations.
 
@@ -194,25 +217,53 @@ class ScratchEnsemble(object):
         else:
             globbedpaths = glob.glob(paths)
 
+        if use_concurrent():
+            # Realization initialization is independent per directory
+            # and dominated by filesystem latency and small-file
+            # parsing, so overlap them in a process pool:
+            with ProcessPoolExecutor() as executor:
+                loaded_reals = list(
+                    executor.map(
+                        functools.partial(
+                            _load_scratch_realization,
+                            realidxregexp=realidxregexp,
+                            autodiscovery=autodiscovery,
+                            batch=batch,
+                        ),
+                        globbedpaths,
+                    )
+                )
+        else:
+            loaded_reals = [
+                ScratchRealization(
+                    realdir,
+                    realidxregexp=realidxregexp,
+                    autodiscovery=autodiscovery,
+                    batch=batch,
+                )
+                for realdir in globbedpaths
+            ]
+
         count = 0
-        for realdir in globbedpaths:
-            realization = ScratchRealization(
-                realdir,
-                realidxregexp=realidxregexp,
-                autodiscovery=autodiscovery,
-                batch=batch,
-            )
+        skipped_paths = []
+        for realdir, realization in zip(globbedpaths, loaded_reals):
             if realization.index is None:
-                logger.critical(
-                    "Could not determine realization index for path %s", realdir
-                )
-                if not realidxregexp:
-                    logger.critical("Maybe you need to supply a regexp.")
-                else:
-                    logger.critical("Your regular expression is maybe wrong.")
+                skipped_paths.append(realdir)
             else:
                 count += 1
                 self.realizations[realization.index] = realization
+        if skipped_paths:
+            # Log the skipped paths once with counts, instead of
+            # spamming the log pipeline once per invalid directory:
+            logger.critical(
+                "Could not determine realization index for %d path(s): %s",
+                len(skipped_paths),
+                " ".join(skipped_paths),
+            )
+            if not realidxregexp:
+                logger.critical("Maybe you need to supply a regexp.")
+            else:
+                logger.critical("Your regular expression is maybe wrong.")
         logger.info("add_realizations() found %d realizations", len(self.realizations))
         return count
 
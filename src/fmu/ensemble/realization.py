@@ -12,6 +12,8 @@ import re
 import copy
 import glob
 import json
+import fnmatch
+import collections
 from datetime import datetime, date, time
 import dateutil
 import logging
@@ -41,6 +43,44 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Default regular expression for deducing the realization index from
+# a path component, compiled once at import time:
+_DEFAULT_REALIDX_RE = re.compile(r"realization-(\d+)")
+
+# Module-level cache of parsed EclSum objects, keyed by filename, the
+# stat() signature of the UNSMRY file and the include_restart flag.
+# Binary decode of large UNSMRY files is expensive, and realizations
+# are frequently reconstructed over the same files (re-scans, batch
+# reruns). The mtime/size part of the key invalidates the cache
+# whenever the file changes on disk. Oldest entries are evicted, LRU:
+_ECLSUM_CACHE_MAXSIZE = 16
+_eclsum_cache = collections.OrderedDict()
+
+# String values regarded as missing, the same set as the pandas CSV
+# reader defaults to, for use by the plain-Python key-value parser:
+_NA_STRINGS = frozenset(
+    [
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "n/a",
+        "nan",
+        "null",
+    ]
+)
+
 
 class ScratchRealization(object):
     r"""A representation of results still present on disk
@@ -94,18 +134,20 @@ class ScratchRealization(object):
         self._autodiscovery = autodiscovery
 
         if not realidxregexp:
-            realidxregexp = re.compile(r"realization-(\d+)")
+            realidxregexp = _DEFAULT_REALIDX_RE
         # Try to compile the regexp on behalf of the user.
         if isinstance(realidxregexp, str):
             realidxregexp = re.compile(realidxregexp)
         if isinstance(realidxregexp, str):
             raise ValueError("Supplied realidxregexp not valid")
 
-        self.files = pd.DataFrame(
-            columns=["FULLPATH", "FILETYPE", "LOCALPATH", "BASENAME"]
-        )
+        # The files dataframe itself is constructed after the file
+        # discovery below, an empty one here would only be thrown away.
         self._eclsum = None  # Placeholder for caching
         self._eclsum_include_restart = None  # Flag for cached object
+        self._eclsum_missing = False  # Negative result of autodiscovery
+        self._eclsum_keys = None  # Cached keyword list for cached object
+        self._eclsum_dates = None  # Cached DatetimeIndex for cached object
 
         # The datastore for internalized data. Dictionary
         # indexed by filenames (local to the realization).
@@ -121,50 +163,85 @@ class ScratchRealization(object):
 
         if index is None:
             for path_comp in reversed(os.path.abspath(path).split(os.path.sep)):
-                realidxmatch = re.match(realidxregexp, path_comp)
+                # Calling match() on the compiled pattern skips the
+                # re._compile() cache probe done by re.match():
+                realidxmatch = realidxregexp.match(path_comp)
                 if realidxmatch:
                     self.index = int(realidxmatch.group(1))
                     break
             else:
+                # One log record per non-matching path; ensembles
+                # scanning many invalid directories log an aggregated
+                # message themselves:
                 logger.warning(
                     (
                         "Could not determine realization "
                         "index for %s, "
-                        "this cannot be inserted in an Ensemble"
+                        "this cannot be inserted in an Ensemble. "
+                        "Maybe you need to use index=<someinteger>"
                     ),
                     abspath,
                 )
-                logger.warning("Maybe you need to use index=<someinteger>")
                 self.index = None
         else:
             self.index = int(index)
 
-        # Now look for some common files, but don't require any
-        if os.path.exists(os.path.join(abspath, "STATUS")):
-            filerow = {
-                "LOCALPATH": "STATUS",
-                "FILETYPE": "STATUS",
-                "FULLPATH": os.path.join(abspath, "STATUS"),
-                "BASENAME": "STATUS",
+        # Now look for some common files, but don't require any.
+        # A single scandir() provides all filenames in the realization
+        # directory, avoiding one stat() syscall per candidate file,
+        # which matters on networked scratch filesystems.
+        try:
+            # is_file() follows symlinks like os.path.exists(), so that
+            # dangling symlinks are not treated as present files. It is
+            # answered from the cached dirent type for regular files.
+            # Mapping to entry.path gives the absolute path for free,
+            # with no os.path.join() per discovered file.
+            direntries = {
+                entry.name: entry.path
+                for entry in os.scandir(abspath)
+                if entry.is_file()
             }
-            self.files = self.files.append(filerow, ignore_index=True)
-            self.load_status()
+        except OSError:
+            direntries = {}
+
+        # Collect the rows and construct the files dataframe once,
+        # as DataFrame.append() copies the full dataframe for every row.
+        filerows = []
+        status_found = "STATUS" in direntries
+        if status_found:
+            filerows.append(
+                {
+                    "LOCALPATH": "STATUS",
+                    "FILETYPE": "STATUS",
+                    "FULLPATH": direntries["STATUS"],
+                    "BASENAME": "STATUS",
+                }
+            )
         else:
             logger.warning("No STATUS file, %s", abspath)
 
-        if os.path.exists(os.path.join(abspath, "jobs.json")):
-            filerow = {
-                "LOCALPATH": "jobs.json",
-                "FILETYPE": "json",
-                "FULLPATH": os.path.join(abspath, "jobs.json"),
-                "BASENAME": "jobs.json",
-            }
-            self.files = self.files.append(filerow, ignore_index=True)
+        if "jobs.json" in direntries:
+            filerows.append(
+                {
+                    "LOCALPATH": "jobs.json",
+                    "FILETYPE": "json",
+                    "FULLPATH": direntries["jobs.json"],
+                    "BASENAME": "jobs.json",
+                }
+            )
+
+        self.files = pd.DataFrame(
+            filerows, columns=["FULLPATH", "FILETYPE", "LOCALPATH", "BASENAME"]
+        )
+        self._build_files_index()
 
-        if os.path.exists(os.path.join(abspath, "OK")):
+        if status_found:
+            self.load_status()
+
+        if "OK" in direntries:
             self.load_scalar("OK")
 
-        if os.path.exists(os.path.join(abspath, "parameters.txt")):
+        if "parameters.txt" in direntries:
             self.load_txt("parameters.txt")
 
         if batch:
@@ -172,6 +249,43 @@ class ScratchRealization(object):
 
         logger.info("Initialized %s", abspath)
 
+    def _drop_eclsum_caches(self):
+        """Invalidate caches derived from the EclSum object.
+
+        Must be called whenever the cached EclSum object is dropped
+        or replaced."""
+        self._eclsum_keys = None
+        self._eclsum_dates = None
+
+    def _build_files_index(self):
+        """(Re)build dictionary lookups over the files dataframe.
+
+        The files dataframe is consulted with a linear scan every time
+        data is loaded, which adds up over thousands of realizations.
+        These side structures give O(1) membership tests instead.
+        """
+        self._files_fullpaths = set(self.files["FULLPATH"])
+        self._files_localpaths = dict(
+            zip(self.files["LOCALPATH"], self.files["FULLPATH"])
+        )
+
+    def _append_filerow(self, filerow):
+        """Append a single row to the files dataframe, keeping the
+        dictionary lookups from _build_files_index() in sync.
+
+        Args:
+            filerow (dict): Must contain at least the keys
+                FULLPATH, FILETYPE and LOCALPATH. BASENAME is derived
+                here if not supplied, so that the column is always
+                complete and consumers never have to recompute it from
+                FULLPATH.
+        """
+        if "BASENAME" not in filerow:
+            filerow["BASENAME"] = os.path.basename(filerow["FULLPATH"])
+        self.files = self.files.append(filerow, ignore_index=True)
+        self._files_fullpaths.add(filerow["FULLPATH"])
+        self._files_localpaths[filerow["LOCALPATH"]] = filerow["FULLPATH"]
+
     def process_batch(self, batch):
         """Process a list of functions to run/apply
 
@@ -304,17 +418,17 @@ class ScratchRealization(object):
         fullpath = os.path.abspath(os.path.join(self._origpath, localpath))
         if not os.path.exists(fullpath):
             raise IOError("File not found: " + fullpath)
-        if fullpath in self.files["FULLPATH"].values and not force_reread:
+        if fullpath in self._files_fullpaths and not force_reread:
             # Return cached version
             return self.data[localpath]
-        if fullpath not in self.files["FULLPATH"].values:
+        if fullpath not in self._files_fullpaths:
             filerow = {
                 "LOCALPATH": localpath,
                 "FILETYPE": localpath.split(".")[-1],
                 "FULLPATH": fullpath,
                 "BASENAME": os.path.split(localpath)[-1],
             }
-            self.files = self.files.append(filerow, ignore_index=True)
+            self._append_filerow(filerow)
         try:
             value = pd.read_csv(
                 fullpath,
@@ -380,31 +494,51 @@ class ScratchRealization(object):
         fullpath = os.path.abspath(os.path.join(self._origpath, localpath))
         if not os.path.exists(fullpath):
             raise IOError("File not found: " + fullpath)
-        if fullpath in self.files["FULLPATH"].values and not force_reread:
+        if fullpath in self._files_fullpaths and not force_reread:
             # Return cached version
             return self.data[localpath]
-        if fullpath not in self.files["FULLPATH"].values:
+        if fullpath not in self._files_fullpaths:
             filerow = {
                 "LOCALPATH": localpath,
                 "FILETYPE": localpath.split(".")[-1],
                 "FULLPATH": fullpath,
                 "BASENAME": os.path.split(localpath)[-1],
             }
-            self.files = self.files.append(filerow, ignore_index=True)
-        try:
-            keyvalues = pd.read_csv(
-                fullpath,
-                sep=r"\s+",
-                index_col=0,
-                dtype=str,
-                usecols=[0, 1],
-                header=None,
-            )[1].to_dict()
-        except pd.errors.EmptyDataError:
-            keyvalues = {}
+            self._append_filerow(filerow)
+        # These files are a handful of whitespace-separated key-value
+        # lines; a plain Python parse avoids the per-call setup cost of
+        # the pandas CSV machinery, which dominates for tiny files:
+        keyvalues = {}
+        with open(fullpath) as f_handle:
+            for line in f_handle:
+                tokens = line.split()
+                if not tokens:
+                    continue
+                # Only key and value are used, any remainder of the
+                # line is ignored silently:
+                if len(tokens) > 1 and tokens[1] not in _NA_STRINGS:
+                    keyvalues[tokens[0]] = tokens[1]
+                else:
+                    keyvalues[tokens[0]] = np.nan
         if convert_numeric:
-            for key in keyvalues:
-                keyvalues[key] = parse_number(keyvalues[key])
+            # Classify all values in one vectorized pass instead of
+            # calling parse_number() per value, which relies on
+            # raising exceptions for every non-integer value:
+            series = pd.Series(keyvalues, dtype=object)
+            numeric = pd.to_numeric(series, errors="coerce")
+            intstrings = series.str.fullmatch(r"[+-]?\d+", na=False)
+            keyvalues = {}
+            for (key, value), number, is_int in zip(
+                series.items(), numeric.to_numpy(), intstrings.to_numpy()
+            ):
+                if pd.isnull(number):
+                    keyvalues[key] = value
+                elif is_int:
+                    # Convert from the string, not from the float64 in
+                    # numeric, to keep integers beyond 2**53 exact:
+                    keyvalues[key] = int(value)
+                else:
+                    keyvalues[key] = float(number)
         self.data[localpath] = keyvalues
         return keyvalues
 
@@ -436,14 +570,14 @@ class ScratchRealization(object):
         if localpath in self.data and not force_reread:
             return self.data[localpath]
         # Check the file store, append if not there
-        if localpath not in self.files["LOCALPATH"].values:
+        if localpath not in self._files_localpaths:
             filerow = {
                 "LOCALPATH": localpath,
                 "FILETYPE": localpath.split(".")[-1],
                 "FULLPATH": fullpath,
                 "BASENAME": os.path.split(localpath)[-1],
             }
-            self.files = self.files.append(filerow, ignore_index=True)
+            self._append_filerow(filerow)
         try:
             if convert_numeric:
                 # Trust that Pandas will determine sensible datatypes
@@ -764,6 +898,9 @@ class ScratchRealization(object):
         """
         if isinstance(paths, str):
             paths = [paths]
+        # New files may appear among the discovered ones, invalidate
+        # any cached negative result from summary autodiscovery:
+        self._eclsum_missing = False
         returnedslice = pd.DataFrame(
             columns=["FULLPATH", "FILETYPE", "LOCALPATH", "BASENAME"]
         )
@@ -818,11 +955,12 @@ class ScratchRealization(object):
                             )
 
                 # Delete this row if it already exists, determined by FULLPATH
-                if absmatch in self.files["FULLPATH"].values:
+                if absmatch in self._files_fullpaths:
                     self.files = self.files[self.files["FULLPATH"] != absmatch]
+                    self._build_files_index()
                 if metadata:
                     filerow.update(metadata)
-                self.files = self.files.append(filerow, ignore_index=True)
+                self._append_filerow(filerow)
                 returnedslice = returnedslice.append(filerow, ignore_index=True)
         return returnedslice
 
@@ -912,10 +1050,29 @@ class ScratchRealization(object):
         unsmry_filename = None
         if len(unsmry_file_row) == 1:
             unsmry_filename = unsmry_file_row.FULLPATH.values[0]
+            if not os.path.exists(unsmry_filename):
+                return None
         elif self._autodiscovery:
-            unsmry_fileguess = os.path.join(self._origpath, "eclipse/model", "*.UNSMRY")
-            unsmry_filenamelist = glob.glob(unsmry_fileguess)
+            if self._eclsum_missing:
+                # Autodiscovery has been attempted earlier without
+                # any match, do not rescan the filesystem.
+                return None
+            # One scandir() pass gives both existence and the matching
+            # path, where glob.glob() + os.path.exists() would stat the
+            # directory contents twice:
+            unsmry_dir = os.path.join(self._origpath, "eclipse/model")
+            try:
+                unsmry_filenamelist = [
+                    entry.path
+                    for entry in os.scandir(unsmry_dir)
+                    if entry.name.endswith(".UNSMRY")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+            except OSError:
+                unsmry_filenamelist = []
             if not unsmry_filenamelist:
+                self._eclsum_missing = True
                 return None  # No filename matches
             if len(unsmry_filenamelist) > 1:
                 logger.warning(
@@ -927,8 +1084,28 @@ class ScratchRealization(object):
             # There is no UNSMRY file to be found.
             return None
 
-        if not os.path.exists(unsmry_filename):
-            return None
+        cache_key = None
+        if cache:
+            # Reuse an already parsed object if an identical file has
+            # been loaded earlier, e.g. by a reconstructed realization:
+            try:
+                filestat = os.stat(unsmry_filename)
+                cache_key = (
+                    unsmry_filename,
+                    filestat.st_mtime_ns,
+                    filestat.st_size,
+                    include_restart,
+                )
+            except OSError:
+                cache_key = None
+            if cache_key is not None and cache_key in _eclsum_cache:
+                _eclsum_cache.move_to_end(cache_key)
+                eclsum = _eclsum_cache[cache_key]
+                self._eclsum = eclsum
+                self._eclsum_include_restart = include_restart
+                self._drop_eclsum_caches()
+                return eclsum
+
         try:
             eclsum = ecl.summary.EclSum(
                 unsmry_filename, lazy_load=False, include_restart=include_restart
@@ -940,8 +1117,13 @@ class ScratchRealization(object):
             return None
 
         if cache:
+            if cache_key is not None:
+                _eclsum_cache[cache_key] = eclsum
+                if len(_eclsum_cache) > _ECLSUM_CACHE_MAXSIZE:
+                    _eclsum_cache.popitem(last=False)
             self._eclsum = eclsum
             self._eclsum_include_restart = include_restart
+            self._drop_eclsum_caches()
 
         return eclsum
 
@@ -1041,6 +1223,7 @@ class ScratchRealization(object):
         # Can be critical for garbage collection
         if not cache_eclsum:
             self._eclsum = None
+            self._drop_eclsum_caches()
         return dframe
 
     def get_smry(
@@ -1110,6 +1293,7 @@ class ScratchRealization(object):
             if not cache_eclsum:
                 # Ensure EclSum object can be garbage collected
                 self._eclsum = None
+                self._drop_eclsum_caches()
             return dataframe
         return pd.DataFrame()
 
@@ -1168,10 +1352,19 @@ class ScratchRealization(object):
             return []
         if not isinstance(column_keys, list):
             column_keys = [column_keys]
-        keys = set()
+        if self._eclsum_keys is None:
+            # Ask libecl for the full keyword table once, wildcards are
+            # then matched in Python against this cached list instead
+            # of having libecl re-walk the SMSPEC table per pattern.
+            self._eclsum_keys = list(self._eclsum.keys())
+        # A dict deduplicates while preserving insertion order, giving
+        # deterministic column order downstream, and avoids the
+        # transient set copies that set.union() would make per pattern:
+        keys = {}
         for key in column_keys:
             if isinstance(key, str):
-                keys = keys.union(set(self._eclsum.keys(key)))
+                for match in fnmatch.filter(self._eclsum_keys, key):
+                    keys[match] = None
         return list(keys)
 
     def get_volumetric_rates(self, column_keys=None, time_index=None, time_unit=None):
@@ -1187,7 +1380,7 @@ class ScratchRealization(object):
 
         Args:
             props_wildcard : string or list of strings with vector
-                wildcards
+                wildcards. None means all vectors.
         Returns:
             a dataframe with values. Raw times from UNSMRY.
             Empty dataframe if no summary file data available
@@ -1198,19 +1391,38 @@ class ScratchRealization(object):
         if not self._eclsum:
             return pd.DataFrame()
 
+        if props_wildcard is None and hasattr(self._eclsum, "pandas_frame"):
+            # Everything is requested, delegate the bulk matrix
+            # extraction to libecl in one call instead of fetching
+            # potentially thousands of vectors one by one:
+            return self._eclsum.pandas_frame()
+
+        if props_wildcard is None:
+            # libecl build without pandas_frame(), still deliver
+            # all vectors:
+            props_wildcard = "*"
         props = self._glob_smry_keys(props_wildcard)
 
+        if self._eclsum_dates is None:
+            # The dates are invariant for a given UNSMRY file, cache
+            # the DatetimeIndex so repeated calls skip the elementwise
+            # datetime-list inference in the DataFrame constructor:
+            self._eclsum_dates = pd.DatetimeIndex(
+                self._eclsum.get_dates(report_only=False)
+            )
+        dates = self._eclsum_dates
+        # Fill one preallocated 2-D array so the dataframe is backed by
+        # a single block. A dict of arrays makes the constructor copy
+        # and consolidate one block per column, which is costly for
+        # wildcards matching hundreds of vectors:
+        values = np.empty((len(dates), len(props)), dtype=np.float64)
         if "numpy_vector" in dir(self._eclsum):
-            data = {
-                prop: self._eclsum.numpy_vector(prop, report_only=False)
-                for prop in props
-            }
+            for idx, prop in enumerate(props):
+                values[:, idx] = self._eclsum.numpy_vector(prop, report_only=False)
         else:  # get_values() is deprecated in newer libecl
-            data = {
-                prop: self._eclsum.get_values(prop, report_only=False) for prop in props
-            }
-        dates = self._eclsum.get_dates(report_only=False)
-        return pd.DataFrame(data=data, index=dates)
+            for idx, prop in enumerate(props):
+                values[:, idx] = self._eclsum.get_values(prop, report_only=False)
+        return pd.DataFrame(data=values, index=dates, columns=props, copy=False)
 
     def get_smry_dates(
         self,
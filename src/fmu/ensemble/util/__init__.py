@@ -2,8 +2,14 @@
 
 
 import os
+import re
 from collections.abc import MutableMapping
 
+# Regular expressions covering the common spellings of numbers,
+# so that parse_number() can classify without raising exceptions:
+_INT_RE = re.compile(r"[+-]?\d+$")
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?$")
+
 
 def flatten(dictionary, parent_key="", sep="_"):
     """Flatten nested dictionaries by introducing new keys
@@ -30,6 +36,21 @@ def flatten(dictionary, parent_key="", sep="_"):
     return dict(items)
 
 
+def use_concurrent():
+    """Determine whether concurrent code paths should be used.
+
+    Concurrency is on by default, but can be turned off by setting
+    the environment variable FMU_CONCURRENCY to "0", "false" or "no".
+
+    Returns:
+        bool: True if concurrent code paths should be used.
+    """
+    env_var = os.environ.get("FMU_CONCURRENCY")
+    if env_var is not None:
+        return env_var.lower() not in ("0", "false", "no")
+    return True
+
+
 def parse_number(value):
     """Try to parse the string first as an integer, then as float,
     if both fails, return the original string.
@@ -55,6 +76,17 @@ def parse_number(value):
             return value
         except ValueError:
             return value  # return float
+    # Raising and catching exceptions is costly in CPython, so strings
+    # are classified with compiled regexes first. Values like "1.23e-5"
+    # would otherwise raise and catch a ValueError on every call:
+    if isinstance(value, str):
+        if _INT_RE.match(value):
+            return int(value)
+        if _FLOAT_RE.match(value):
+            return float(value)
+    # Rare spellings like "inf" or "nan", and numpy number types,
+    # are not covered by the regexes, fall back to exception-driven
+    # parsing:
     try:
         return int(value)
     except ValueError:
@@ -197,6 +197,19 @@ def test_noparameters():
         reekensemble.get_df("unsmry--yearly", merge="parameters.txt")
 
 
+def test_serial_loading(monkeypatch):
+    """Test that realizations load correctly also when concurrency
+    is turned off through the environment"""
+    monkeypatch.setenv("FMU_CONCURRENCY", "0")
+
+    testdir = os.path.dirname(os.path.abspath(__file__))
+    reekensemble = ScratchEnsemble(
+        "reektest", testdir + "/data/testensemble-reek001/" + "realization-*/iter-0"
+    )
+    assert len(reekensemble) == 5
+    assert len(reekensemble.parameters.columns) == 26  # 25 parameters + REAL
+
+
 def test_emptyens():
     """Check that we can initialize an empty ensemble"""
     ens = ScratchEnsemble("emptyens")
@@ -485,6 +485,12 @@ def test_singlereal_ecl(tmp="TMP"):
     assert real.load_smry(column_keys=["FOP*"])["FOPT"].max() > 6000000
     assert real.get_smryvalues("FOPT")["FOPT"].max() > 6000000
 
+    # None means all vectors:
+    allvalues = real.get_smryvalues()
+    assert len(allvalues) == 378
+    assert len(allvalues.columns) >= 470
+    assert allvalues["FOPT"].max() > 6000000
+
     # get_smry() should be analogue to load_smry(), but it should
     # not modify the internalized dataframes!
     internalized_df = real["unsmry--raw"]
@@ -615,6 +621,37 @@ def test_singlereal_ecl(tmp="TMP"):
         "FOPT" in real["unsmry--yearly"]
 
 
+def test_eclsum_cache(tmpdir):
+    """Test the module level cache of parsed EclSum objects"""
+    testdir = os.path.dirname(os.path.abspath(__file__))
+    realdir = os.path.join(testdir, "data/testensemble-reek001", "realization-0/iter-0")
+
+    # Copy the summary files to a writable location so mtime
+    # manipulation does not disturb the shared test data:
+    modeldir = (
+        tmpdir.mkdir("realization-0").mkdir("iter-0").mkdir("eclipse").mkdir("model")
+    )
+    for fname in ["2_R001_REEK-0.SMSPEC", "2_R001_REEK-0.UNSMRY"]:
+        shutil.copy(os.path.join(realdir, "eclipse/model", fname), str(modeldir))
+    tmprealdir = str(tmpdir.join("realization-0/iter-0"))
+
+    # Two realizations over the same UNSMRY file share one parsed object:
+    real1 = ensemble.ScratchRealization(tmprealdir)
+    real2 = ensemble.ScratchRealization(tmprealdir)
+    assert real1.get_eclsum() is real2.get_eclsum()
+
+    # A differing include_restart is a cache miss:
+    assert real1.get_eclsum() is not real2.get_eclsum(include_restart=False)
+
+    # Touching the mtime invalidates the cache and forces a re-parse:
+    cached = real1.get_eclsum()
+    unsmry_filename = str(modeldir.join("2_R001_REEK-0.UNSMRY"))
+    filestat = os.stat(unsmry_filename)
+    os.utime(unsmry_filename, ns=(filestat.st_atime_ns, filestat.st_mtime_ns + 1))
+    real3 = ensemble.ScratchRealization(tmprealdir)
+    assert real3.get_eclsum() is not cached
+
+
 def test_independent_realization(tmp="TMP"):
     """Test what we are able to load a single Eclipse run
     that might have nothing to do with FMU"""
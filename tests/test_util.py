@@ -6,7 +6,7 @@ import numpy as np
 
 import pytest
 
-from fmu.ensemble.util import flatten, parse_number, shortcut2path
+from fmu.ensemble.util import flatten, parse_number, shortcut2path, use_concurrent
 from fmu.ensemble.util.dates import normalize_dates
 from fmu.ensemble.util.rates import cumcolumn_to_ratecolumn
 
@@ -80,6 +80,18 @@ def test_parse_number():
     assert isinstance(parse_number(np.nan), float)
 
 
+def test_use_concurrent(monkeypatch):
+    """Test parsing of the environment variable switching off concurrency"""
+    monkeypatch.delenv("FMU_CONCURRENCY", raising=False)
+    assert use_concurrent()
+    for falsy in ["0", "false", "False", "FALSE", "no", "No"]:
+        monkeypatch.setenv("FMU_CONCURRENCY", falsy)
+        assert not use_concurrent()
+    for truthy in ["1", "true", "yes", ""]:
+        monkeypatch.setenv("FMU_CONCURRENCY", truthy)
+        assert use_concurrent()
+
+
 def test_shortcut2path():
     """Test the shortcut-functionality used for looking up
     internalized data in realizations or ensemble objects"""